@@ -35,6 +35,8 @@ class Assignments(ListView):
 
 
 class AssignmentsScreen(Screen):
+    BINDINGS = [("r", "reload", "Reload from Canvas")]
+
     app: "GradingTool"
 
     def compose(self) -> ComposeResult:
@@ -53,3 +55,7 @@ class AssignmentsScreen(Screen):
 
     def on_mount(self) -> None:
         self.query_one("Assignments").focus()
+
+    def action_reload(self) -> None:
+        self.dismiss()
+        self.app.load_assignments_and_students(use_cache=False)
@@ -1,7 +1,16 @@
+import json
+import os
+import time
+from pathlib import Path
+
+import platformdirs
 from canvas_course_tools.canvas_tasks import CanvasTasks
 from canvas_course_tools.datatypes import Assignment, Course, Student
+from slugify import slugify
 from unidecode import unidecode
 
+CACHE_TTL = 10 * 60
+
 
 def get_assignments(
     canvas_tasks: CanvasTasks, course: Course, group_name: str
@@ -72,3 +81,104 @@ def get_group_from_groupset_by_name(group_name, canvas, groupset):
     except StopIteration:
         raise RuntimeError(f"Group {group_name} not found in group set {groupset.name}")
     return group
+
+
+def get_cache_path(course: Course, *keys: str | None) -> Path:
+    """Get the path of the cache file for a course and selection of students
+
+    Args:
+        course (Course): the course object
+        *keys (str | None): additional keys, e.g. assignment group and group name
+
+    Returns:
+        Path: the path of the cache file
+    """
+    name = slugify(" ".join([str(course.id), *(str(key) for key in keys)]))
+    return Path(platformdirs.user_cache_dir("ecpcgrading")) / f"{name}.json"
+
+
+def read_cache(
+    path: Path, course: Course
+) -> tuple[list[Assignment], list[Student]] | None:
+    """Read cached assignments and students
+
+    The cache only contains plain data, so the assignments are linked to the
+    (freshly retrieved) course object.
+
+    Args:
+        path (Path): the path of the cache file
+        course (Course): the course object containing the assignments
+
+    Returns:
+        tuple[list[Assignment], list[Student]] | None: the assignments and
+            students, or None if the cache is missing, expired or corrupt
+    """
+    try:
+        if time.time() - path.stat().st_mtime >= CACHE_TTL:
+            return None
+        data = json.loads(path.read_text())
+        assignments = [
+            Assignment(
+                id=a["id"],
+                name=a["name"],
+                course=course,
+                submission_types=a["submission_types"],
+            )
+            for a in data["assignments"]
+        ]
+        students = []
+        for s in data["students"]:
+            student = Student(
+                id=s["id"],
+                name=s["name"],
+                sortable_name=s["sortable_name"],
+                notes=s["notes"],
+            )
+            # names were already parsed from the original (underscored) name
+            student.first_name, student.last_name = s["first_name"], s["last_name"]
+            students.append(student)
+    except (OSError, ValueError, KeyError, TypeError):
+        # missing, unreadable or corrupt cache file
+        return None
+    return assignments, students
+
+
+def write_cache(
+    path: Path, assignments: list[Assignment], students: list[Student]
+) -> None:
+    """Write assignments and students to the cache
+
+    Only plain data is written, no Canvas API objects (which contain the access
+    token). Since it contains student names, the file is only readable by the
+    user. Failing to write the cache is silently ignored.
+
+    Args:
+        path (Path): the path of the cache file
+        assignments (list[Assignment]): the assignments
+        students (list[Student]): the students
+    """
+    data = {
+        "assignments": [
+            {"id": a.id, "name": a.name, "submission_types": a.submission_types}
+            for a in assignments
+        ],
+        "students": [
+            {
+                "id": s.id,
+                "name": s.name,
+                "sortable_name": s.sortable_name,
+                "first_name": s.first_name,
+                "last_name": s.last_name,
+                "notes": s.notes,
+            }
+            for s in students
+        ],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+    except OSError:
+        # the cache is best-effort, the data was retrieved successfully
+        pass
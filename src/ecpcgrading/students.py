@@ -146,14 +146,14 @@ class GradeStudentCommands(Provider):
 
     async def search(self, query: str) -> Hits:
         matcher = self.matcher(query)
-        for student in self.screen.query_one(Students).children:
+        for idx, student in enumerate(self.screen.query_one(Students).children):
             command = f"grade {student.student_name}"
             score = matcher.match(command)
             if score > 0:
                 yield Hit(
                     score,
                     matcher.highlight(command),
-                    partial(self.screen.highlight_student, student),
+                    partial(self.screen.highlight_student, idx),
                 )
 
 
@@ -226,7 +226,5 @@ class StudentsScreen(Screen):
     def show_tasks(self, student: Student) -> None:
         self.app.push_screen(TasksScreen(self.assignment, student))
 
-    def highlight_student(self, student: Student) -> None:
-        students = self.query_one(Students)
-        idx = students.children.index(student)
-        students.index = idx
+    def highlight_student(self, idx: int) -> None:
+        self.query_one(Students).index = idx
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
+import shlex
 import shutil
 import stat
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING
-from zipfile import ZipFile
+from zipfile import ZipFile, ZipInfo
 
 import requests
 from canvas_course_tools.datatypes import Assignment as CanvasAssignment
@@ -39,6 +43,9 @@ if TYPE_CHECKING:
     from ecpcgrading.students import Student
     from ecpcgrading.tui import GradingTool
 
+EXTRACT_POOL_SIZE = min(32, (os.cpu_count() or 1) * 2)
+EXTRACT_POOL_MIN_SIZE = 8 << 20
+
 
 class Task(ListItem):
     run_msg: str = "Running task..."
@@ -178,7 +185,7 @@ class UncompressCodeTask(Task):
         code_dir = get_code_dir(self.app.config, self._assignment, self._student)
         student_name = slugify(self._student.name)
 
-        match list(submissions_dir.glob(f"{student_name}_*")):
+        match find_submissions(submissions_dir, student_name):
             case [path]:
                 if code_dir.exists():
                     self.app.call_from_thread(
@@ -190,8 +197,7 @@ class UncompressCodeTask(Task):
                 Path.mkdir(code_dir, parents=True)
                 match path.suffix:
                     case ".zip":
-                        with ZipFile(path) as f:
-                            f.extractall(path=code_dir)
+                        extract_zip(path, code_dir)
                         self.app.call_from_thread(
                             self.notify, "Extracted submitted files"
                         )
@@ -234,8 +240,16 @@ class CreateEnvTask(Task):
     def run_task(self):
         env_name = "ECPC_" + slugify(self._student.name)
         process = subprocess.run(
-            f"conda create -n {env_name} -c {self.env.channel} {self.env.package_spec} --yes",
-            shell=True,
+            [
+                find_env_creator(),
+                "create",
+                "-n",
+                env_name,
+                "-c",
+                self.env.channel,
+                *shlex.split(self.env.package_spec),
+                "--yes",
+            ],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
         )
@@ -258,9 +272,11 @@ class OpenCodeTask(Task):
         env_name = "ECPC_" + slugify(self._student.name)
         code_dir = config.root_path / assignment / config.code_path / student_name
 
-        dir_contents: Path = list(code_dir.iterdir())
+        # DirEntry caches the file type, so is_dir() needs no extra stat call
+        with os.scandir(code_dir) as entries:
+            dir_contents = list(entries)
         if len(dir_contents) == 1 and dir_contents[0].is_dir():
-            code_dir = dir_contents[0]
+            code_dir = Path(dir_contents[0].path)
 
         # A bug in VS Code on macOS breaks environment activation.
         # Ref: https://github.com/microsoft/vscode-python/issues/23571
@@ -276,17 +292,13 @@ class OpenCodeTask(Task):
         #     raise RuntimeError(f"Process exited with exit code: {process.returncode}")
 
         # find the student environment's Python interpreter
-        process = subprocess.run(
-            f'conda run -n {env_name} python -c "import sys; print(sys.executable)"',
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-        )
-        if process.returncode:
-            raise RuntimeError(f"Process exited with exit code: {process.returncode}")
+        python_path = get_env_python(env_name)
+        if not Path(python_path).exists():
+            # environment was removed since the interpreter was looked up
+            get_env_python.cache_clear()
+            python_path = get_env_python(env_name)
 
         # write a .vscode/settings.json with that interpreter selected
-        python_path = process.stdout.decode().strip()
         (settings_dir := code_dir / ".vscode").mkdir(parents=True, exist_ok=True)
         (settings_dir / "settings.json").write_text(
             json.dumps({"python.defaultInterpreterPath": python_path})
@@ -294,8 +306,7 @@ class OpenCodeTask(Task):
 
         # start VS Code
         process = subprocess.run(
-            f'code "{code_dir}"',
-            shell=True,
+            [find_executable("code"), code_dir],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
         )
@@ -317,6 +328,109 @@ def get_code_dir(config: Config, assignment: CanvasAssignment, student: CanvasSt
     )
 
 
+def find_submissions(submissions_dir: Path, student_name: str) -> list[Path]:
+    """Find all submission files of a student in a single directory scan."""
+    prefix = f"{student_name}_"
+    try:
+        with os.scandir(submissions_dir) as entries:
+            return [Path(e.path) for e in entries if e.name.startswith(prefix)]
+    except FileNotFoundError:
+        return []
+
+
+def find_executable(name: str) -> str:
+    """Locate an executable on the PATH, so it can be run without a shell.
+
+    On Windows, conda and code are batch files which are only found by the
+    shell, unless the full path is given.
+    """
+    return shutil.which(name) or name
+
+
+def find_env_creator() -> str:
+    """Locate mamba if installed, since it solves environments faster than conda.
+
+    Only a mamba next to $CONDA_EXE is used, so that environments are created
+    in the conda installation where get_env_python() looks for them.
+    """
+    if conda_exe := os.environ.get("CONDA_EXE"):
+        conda_exe = Path(conda_exe)
+        mamba_exe = conda_exe.with_name("mamba" + conda_exe.suffix)
+        if mamba_exe.exists():
+            return str(mamba_exe)
+    return find_executable("conda")
+
+
+@functools.cache
+def get_env_python(env_name: str) -> str:
+    """Return the path of the Python interpreter of a conda environment.
+
+    The interpreter is first looked up in the envs directory of the conda
+    installation. Only for environments stored elsewhere, fall back to asking
+    conda itself. The result is cached, since starting 'conda run' takes a few
+    seconds.
+    """
+    if conda_exe := os.environ.get("CONDA_EXE"):
+        env_dir = Path(conda_exe).parent.parent / "envs" / env_name
+        if sys.platform == "win32":
+            python_path = env_dir / "python.exe"
+        else:
+            python_path = env_dir / "bin" / "python"
+        if python_path.exists():
+            return str(python_path)
+
+    process = subprocess.run(
+        [
+            find_executable("conda"),
+            "run",
+            "-n",
+            env_name,
+            "python",
+            "-c",
+            "import sys; print(sys.executable)",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    if process.returncode:
+        raise RuntimeError(f"Process exited with exit code: {process.returncode}")
+    return process.stdout.decode().strip()
+
+
+def extract_zip(path: Path, target_dir: Path) -> None:
+    """Extract a zip file, decompressing large archives in parallel threads.
+
+    zlib releases the GIL while decompressing, so archives containing a lot of
+    data are extracted faster using a pool of threads. For small archives,
+    starting the threads costs more than it saves, so they are extracted
+    serially.
+    """
+    with ZipFile(path) as zip_file:
+        members = zip_file.infolist()
+        if sum(m.file_size for m in members) < EXTRACT_POOL_MIN_SIZE:
+            for member in members:
+                extract_member(zip_file, member, target_dir)
+            return
+        pool_size = min(EXTRACT_POOL_SIZE, len(members))
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            futures = [
+                executor.submit(extract_member, zip_file, member, target_dir)
+                for member in members
+            ]
+            for future in as_completed(futures):
+                # re-raise any exception from the worker threads
+                future.result()
+
+
+def extract_member(zip_file: ZipFile, member: ZipInfo, target_dir: Path) -> None:
+    """Extract a single zip member, letting ZipFile.extract() sanitize its path."""
+    try:
+        zip_file.extract(member, target_dir)
+    except FileExistsError:
+        # another thread created the same parent directory in the meantime
+        zip_file.extract(member, target_dir)
+
+
 def remove_readonly(func, path, excinfo):
     """Make a path writable and retry the failed function call."""
     os.chmod(path, stat.S_IWRITE)
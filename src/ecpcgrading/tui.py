@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 
 from canvas_course_tools.canvas_tasks import CanvasTasks
@@ -5,12 +6,11 @@ from canvas_course_tools.datatypes import Assignment as CanvasAssignment
 from canvas_course_tools.datatypes import Course as CanvasCourse
 from canvas_course_tools.datatypes import Student as CanvasStudent
 from canvas_course_tools.utils import find_course
-from textual import on, work
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Center, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Label, LoadingIndicator
-from textual.worker import Worker, WorkerState
 
 import ecpcgrading.config
 from ecpcgrading import canvas
@@ -20,6 +20,10 @@ from ecpcgrading.assignments import AssignmentsScreen
 class StartupScreen(ModalScreen):
     app: "GradingTool"
 
+    def __init__(self, use_cache: bool = True) -> None:
+        super().__init__()
+        self.use_cache = use_cache
+
     def compose(self) -> ComposeResult:
         with Vertical(id="modal_dialog"):
             with Center():
@@ -30,25 +34,36 @@ class StartupScreen(ModalScreen):
         self.query_one("#msg").update("Fetching assignments and students...")
         self.get_assignments_and_students()
 
-    @work(thread=True)
-    def get_assignments_and_students(self) -> list[str]:
+    @work(exclusive=True)
+    async def get_assignments_and_students(self) -> None:
         config: ecpcgrading.config.Config = self.app.config
-        canvas_tasks, course = find_course(config.course_alias)
-        assignments = canvas.get_assignments(
-            canvas_tasks, course, config.assignment_group
-        )
-        students = canvas.get_students(
-            canvas_tasks, course, config.groupset, config.group
+        canvas_tasks, course = await asyncio.to_thread(find_course, config.course_alias)
+        cache_path = canvas.get_cache_path(
+            course, config.assignment_group, config.groupset, config.group
         )
+        if self.use_cache and (cached := canvas.read_cache(cache_path, course)):
+            assignments, students = cached
+        else:
+            # assignments and students are independent, so request them in parallel
+            assignments, students = await asyncio.gather(
+                asyncio.to_thread(
+                    canvas.get_assignments,
+                    canvas_tasks,
+                    course,
+                    config.assignment_group,
+                ),
+                asyncio.to_thread(
+                    canvas.get_students,
+                    canvas_tasks,
+                    course,
+                    config.groupset,
+                    config.group,
+                ),
+            )
+            canvas.write_cache(cache_path, assignments, students)
         self.app.canvas_tasks = canvas_tasks
         self.app.course = course
-        return assignments, students
-
-    @on(Worker.StateChanged)
-    def return_assignments(self, event: Worker.StateChanged) -> None:
-        if event.state == WorkerState.SUCCESS:
-            assignments, students = event.worker.result
-            self.dismiss((assignments, students))
+        self.dismiss((assignments, students))
 
 
 class GradingTool(App):
@@ -71,11 +86,14 @@ class GradingTool(App):
         self.theme = self.config.theme
 
     def on_mount(self) -> None:
+        self.load_assignments_and_students()
+
+    def load_assignments_and_students(self, use_cache: bool = True) -> None:
         def callback(result):
             self.assignments, self.students = result
             self.push_screen(AssignmentsScreen())
 
-        self.app.push_screen(StartupScreen(), callback=callback)
+        self.push_screen(StartupScreen(use_cache), callback=callback)
 
 
 def app():
@@ -0,0 +1,100 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from canvas_course_tools.datatypes import Assignment, Course, Student
+
+from ecpcgrading import canvas
+
+
+@pytest.fixture
+def course() -> Course:
+    return Course(id=1234, name="ECPC", course_code="ECPC", term="2024")
+
+
+@pytest.fixture
+def assignments(course: Course) -> list[Assignment]:
+    return [
+        Assignment(
+            id=1,
+            name="Assignment 1",
+            course=course,
+            submission_types=["online_upload"],
+            _api=object(),
+        )
+    ]
+
+
+@pytest.fixture
+def students() -> list[Student]:
+    return [
+        Student(id=2, name="Jan_Piet Smit", sortable_name="Smit, Jan Piet"),
+        Student(id=3, name="Test Student", notes="test student"),
+    ]
+
+
+def test_cache_round_trip(
+    tmp_path: Path,
+    course: Course,
+    assignments: list[Assignment],
+    students: list[Student],
+):
+    path = tmp_path / "cache" / "course.json"
+    canvas.write_cache(path, assignments, students)
+    cached_assignments, cached_students = canvas.read_cache(path, course)
+
+    # API objects are not cached, assignments link to the given course
+    assert cached_assignments == [
+        Assignment(
+            id=1, name="Assignment 1", course=course, submission_types=["online_upload"]
+        )
+    ]
+    assert cached_assignments[0].course is course
+    assert cached_students == students
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file permissions")
+def test_cache_is_private(
+    tmp_path: Path, assignments: list[Assignment], students: list[Student]
+):
+    path = tmp_path / "course.json"
+    canvas.write_cache(path, assignments, students)
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_cache_expires(
+    tmp_path: Path,
+    course: Course,
+    assignments: list[Assignment],
+    students: list[Student],
+):
+    path = tmp_path / "course.json"
+    canvas.write_cache(path, assignments, students)
+    mtime = time.time() - canvas.CACHE_TTL - 1
+    os.utime(path, (mtime, mtime))
+    assert canvas.read_cache(path, course) is None
+
+
+@pytest.mark.parametrize("contents", ["", "not json", "[]", '{"assignments": []}'])
+def test_corrupt_cache(tmp_path: Path, course: Course, contents: str):
+    path = tmp_path / "course.json"
+    path.write_text(contents)
+    assert canvas.read_cache(path, course) is None
+
+
+def test_missing_cache(tmp_path: Path, course: Course):
+    assert canvas.read_cache(tmp_path / "course.json", course) is None
+
+
+def test_unwritable_cache(
+    tmp_path: Path,
+    course: Course,
+    assignments: list[Assignment],
+    students: list[Student],
+):
+    (parent := tmp_path / "not_a_directory").touch()
+    path = parent / "course.json"
+    canvas.write_cache(path, assignments, students)
+    assert canvas.read_cache(path, course) is None
@@ -0,0 +1,68 @@
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+
+from ecpcgrading import tasks
+
+
+def list_tree(root: Path) -> dict[str, bytes | None]:
+    return {
+        path.relative_to(root).as_posix(): None if path.is_dir() else path.read_bytes()
+        for path in root.rglob("*")
+    }
+
+
+@pytest.fixture
+def submission(tmp_path: Path) -> Path:
+    path = tmp_path / "student_submission.zip"
+    with ZipFile(path, mode="w", compression=ZIP_DEFLATED) as f:
+        f.writestr("project/", "")
+        f.writestr("project/pyproject.toml", "[tool.poetry]\n")
+        f.writestr("project/src/pkg/__init__.py", "")
+        f.writestr("project/src/pkg/main.py", "print('hello')\n" * 1000)
+        f.writestr("project/data/empty/", "")
+        f.writestr("README.md", "# Submission\n")
+    return path
+
+
+@pytest.mark.parametrize("pool_min_size", [0, tasks.EXTRACT_POOL_MIN_SIZE])
+def test_extract_zip_matches_extractall(
+    submission: Path, tmp_path: Path, monkeypatch, pool_min_size
+):
+    monkeypatch.setattr(tasks, "EXTRACT_POOL_MIN_SIZE", pool_min_size)
+    with ZipFile(submission) as f:
+        f.extractall(path=tmp_path / "expected")
+    tasks.extract_zip(submission, tmp_path / "actual")
+    assert list_tree(tmp_path / "actual") == list_tree(tmp_path / "expected")
+
+
+def test_extract_zip_sanitizes_member_names(tmp_path: Path):
+    path = tmp_path / "student_submission.zip"
+    with ZipFile(path, mode="w") as f:
+        f.writestr("/abs/file.py", "absolute")
+        f.writestr("../../evil.py", "parent")
+        f.writestr("./sub/../ok.py", "dots")
+    with ZipFile(path) as f:
+        f.extractall(path=tmp_path / "expected")
+    tasks.extract_zip(path, tmp_path / "actual")
+    assert list_tree(tmp_path / "actual") == list_tree(tmp_path / "expected")
+    assert list_tree(tmp_path / "actual") == {
+        "abs": None,
+        "abs/file.py": b"absolute",
+        "evil.py": b"parent",
+        "sub": None,
+        "sub/ok.py": b"dots",
+    }
+
+
+def test_find_env_creator_uses_mamba_from_conda_installation(
+    tmp_path: Path, monkeypatch
+):
+    (bin_dir := tmp_path / "bin").mkdir()
+    (bin_dir / "conda").touch()
+    monkeypatch.setenv("CONDA_EXE", str(bin_dir / "conda"))
+    monkeypatch.setattr(tasks, "find_executable", lambda name: name)
+    assert tasks.find_env_creator() == "conda"
+    (bin_dir / "mamba").touch()
+    assert tasks.find_env_creator() == str(bin_dir / "mamba")